@@ -6,21 +6,41 @@
 #
 #
 import argparse
+import hashlib
+import json
 import pathlib
 import logging
 import os
+import signal
+import subprocess
 import time
-import glob
+import shutil
+import zipfile
 
 from o3de.validation import valid_o3de_project_json, valid_o3de_engine_json
-from queue import Queue, Empty
-from threading  import Thread
-from typing import List
-from subprocess import Popen, PIPE
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock, Thread
+from typing import Callable, List, NamedTuple, Tuple
+from subprocess import Popen, PIPE, DEVNULL, TimeoutExpired
 
 logger = logging.getLogger('o3de.gamejam')
 LOG_FORMAT = '[%(levelname)s] %(name)s: %(message)s'
 logging.basicConfig(format=LOG_FORMAT)
+# Extensions of files in the Release Directory whose contents are already compressed
+PRECOMPRESSED_EXTENSIONS = ('.pak', '.zip')
+# Subprocess output is logged in batches of at most this many lines, and at least this often (in seconds)
+LOG_BATCH_LINES = 64
+LOG_BATCH_INTERVAL = 0.25
+# Maximum number of bytes taken from a subprocess stdout pipe per read
+STDOUT_READ_SIZE = 65536
+# Fingerprints of engine/project json files that have already passed validation
+VALIDATION_CACHE_PATH = pathlib.Path.home() / '.o3de' / 'export_validation_cache.json'
+# On Windows each command is started in its own process group, so that safe_kill_processes can also stop its children (e.g. MSBuild nodes).
+# Such a group does not receive the console's Ctrl-C; CLICommand.run waits in short slices so the KeyboardInterrupt reaches this script,
+# which then forwards it to the group as a break event.
+PROCESS_CREATION_FLAGS = getattr(subprocess, 'CREATE_NEW_PROCESS_GROUP', 0)
+# Seconds a process group is given to exit after the break event before it is killed
+PROCESS_BREAK_GRACE_PERIOD = 5
 # This is an export script for MPS on the Windows platform
 # this has to be a complete standalone script, b/c project export doesnt exist in main branch yet
 
@@ -29,16 +49,12 @@ logging.basicConfig(format=LOG_FORMAT)
 # @<O3DE_ENGINE_ROOT_PATH>
 # > python\python.cmd <O3DE_MPS_PROJECT_ROOT_PATH>\ExportScripts\export_standalone_monolithic_windows.py -ps <O3DE_MPS_PROJECT_ROOT_PATH> -egn <O3DE_ENGINE_ROOT_PATH> -bnmt -out <MPS_OUTPUT_RELEASE_DIR_PATH> -zip
 
-def enqueue_output(out, queue):
-    for line in iter(out.readline, b''):
-        queue.put(line)
-    out.close()
-
-def safe_kill_processes(*processes: List[Popen], process_logger: logging.Logger = None) -> None:
+def safe_kill_processes(*processes: List[Popen], process_logger: logging.Logger = None, timeout: float = 30) -> None:
     """
     Kills a given process without raising an error
     :param processes: An iterable of processes to kill
     :param process_logger: (Optional) logger to use
+    :param timeout: (Optional) Maximum number of seconds to wait for all of the processes to terminate
     """
     def on_terminate(proc) -> None:
         try:
@@ -49,25 +65,46 @@ def safe_kill_processes(*processes: List[Popen], process_logger: logging.Logger
     if not process_logger:
         process_logger = logger
     
+    signalled = []
     for proc in processes:
         try:
             process_logger.info(f"Terminating process '{proc.args[0]}' with PID({proc.pid})")
+            if PROCESS_CREATION_FLAGS and proc.poll() is None:
+                # kill() only ends the process itself, the break event reaches the rest of its process group
+                proc.send_signal(signal.CTRL_BREAK_EVENT)
+                signalled.append(proc)
+        except Exception:  # purposefully broad
+            process_logger.error("Unexpected exception ignored while terminating process, with stacktrace:", exc_info=True)
+    # all processes share a single deadline, so the total wait is bounded regardless of how many there are
+    deadline = time.monotonic() + timeout
+    # give the signalled process groups a chance to shut down cleanly before anything is killed
+    break_deadline = min(deadline, time.monotonic() + PROCESS_BREAK_GRACE_PERIOD)
+    for proc in signalled:
+        try:
+            proc.wait(timeout=max(0, break_deadline - time.monotonic()))
+        except TimeoutExpired:
+            pass
+        except Exception:  # purposefully broad
+            process_logger.error("Unexpected exception while waiting for process to handle the break event, with stacktrace:", exc_info=True)
+    for proc in processes:
+        try:
             proc.kill()
         except Exception:  # purposefully broad
             process_logger.error("Unexpected exception ignored while terminating process, with stacktrace:", exc_info=True)
-    try:
-        for proc in processes:
-            proc.wait(timeout=30)
+    for proc in processes:
+        try:
+            proc.wait(timeout=max(0, deadline - time.monotonic()))
             on_terminate(proc)
-    except Exception:  # purposefully broad
-        process_logger.error("Unexpected exception while waiting for processes to terminate, with stacktrace:", exc_info=True)
+        except Exception:  # purposefully broad
+            process_logger.error("Unexpected exception while waiting for processes to terminate, with stacktrace:", exc_info=True)
 
 class CLICommand(object):
     """
     CLICommand is an interface for storing CLI commands as list of string arguments to run later in a script.
     A current working directory, pre-existing OS environment, and desired logger can also be specified.
+    Stdout is only read when the logger shows INFO messages; otherwise it is discarded.
     To execute a command, use the run() function.
-    This class is responsible for starting a new process, polling it for updates and logging, and safely terminating it.
+    This class is responsible for starting a new process, reading its output for logging, and safely terminating it.
     """
     def __init__(self, 
                 args: list,
@@ -101,55 +138,70 @@ class CLICommand(object):
         """The result of stderr, as a single string."""
         return "\n".join(self._stderr_lines)
 
-    def _poll_process(self, process, queue) -> None:
-        # while process is not done, read any log lines coming from subprocess
-        while process.poll() is None:
-            #handle readline in a non-blocking manner
-            try:  line = queue.get_nowait() 
-            except Empty:
-                pass
-            else: # got line
-                if not line: break
-                log_line = line.decode('utf-8', 'ignore')
-                self._stdout_lines.append(log_line)
-                self.logger.info(log_line)
-    
-    def _cleanup_process(self, process, queue) -> str:
-        # flush remaining log lines
-        while not queue.empty():
-            try: line = queue.get_nowait()
-            except Empty:
-                pass
-            else:
-                if not line: break
-                log_line = line.decode('utf-8', 'ignore')
-                self._stdout_lines.append(log_line)
-                self.logger.info(log_line)
-        stderr = process.stderr.read()
-
-        safe_kill_processes(process, process_logger = self.logger)
-
-        return stderr
-    
+    def _flush_stdout_lines(self, pending_lines: List[str]) -> None:
+        # log a batch of lines with a single record, rather than paying the logging overhead per line
+        if not pending_lines:
+            return
+        self._stdout_lines.extend(pending_lines)
+        self.logger.info(''.join(pending_lines).rstrip())
+        pending_lines.clear()
+
+    def _read_stdout(self, stdout, pending_lines: List[str], lock: Lock) -> None:
+        # take whatever is available in one read, and split the block into lines in bulk
+        partial_line = b''
+        while chunk := stdout.read1(STDOUT_READ_SIZE):
+            lines = (partial_line + chunk).split(b'\n')
+            partial_line = lines.pop()
+            with lock:
+                pending_lines.extend(line.decode('utf-8', 'ignore') + '\n' for line in lines)
+                if len(pending_lines) >= LOG_BATCH_LINES:
+                    self._flush_stdout_lines(pending_lines)
+        if partial_line:
+            with lock:
+                pending_lines.append(partial_line.decode('utf-8', 'ignore'))
+
     def run(self) -> int:
         """
         Takes the arguments specified during CLICommand initialization, and opens a new subprocess to handle it.
-        This function automatically manages polling the process for logs, error reporting, and safely cleaning up the process afterwards.
+        This function automatically manages reading the process logs, error reporting, and safely cleaning up the process afterwards.
         :return return code on success or failure 
         """
         ret = 1
+        # when nothing would consume stdout, let the OS discard it instead of reading and decoding every line
+        read_stdout = self.logger.isEnabledFor(logging.INFO)
         try:
-            with Popen(self.args, cwd=self.cwd, env=self.env, stdout=PIPE, stderr=PIPE) as process:
+            with Popen(self.args, cwd=self.cwd, env=self.env, stdout=PIPE if read_stdout else DEVNULL, stderr=PIPE,
+                       creationflags=PROCESS_CREATION_FLAGS) as process:
                 self.logger.info(f"Running process '{self.args[0]}' with PID({process.pid}): {self.args}")
 
-                q = Queue()
-                t = Thread(target=enqueue_output, args=(process.stdout, q))
-                t.daemon = True
-                t.start()
-
-                process.stdout.flush()
-                self._poll_process(process, q)
-                stderr = self._cleanup_process(process, q)
+                # drain stderr alongside stdout, so a child that fills the stderr pipe cannot stall while stdout is being read
+                stderr_output = []
+                stderr_reader = Thread(target=lambda: stderr_output.append(process.stderr.read()), daemon=True)
+                stderr_reader.start()
+
+                pending_lines = []
+                pending_lines_lock = Lock()
+                readers = [stderr_reader]
+                if read_stdout:
+                    stdout_reader = Thread(target=self._read_stdout, args=(process.stdout, pending_lines, pending_lines_lock), daemon=True)
+                    stdout_reader.start()
+                    readers.append(stdout_reader)
+
+                try:
+                    # wait in short slices, so that output is logged while the process is quiet
+                    while True:
+                        try:
+                            process.wait(timeout=LOG_BATCH_INTERVAL)
+                            break
+                        except TimeoutExpired:
+                            with pending_lines_lock:
+                                self._flush_stdout_lines(pending_lines)
+                    for reader in readers:
+                        reader.join()
+                    self._flush_stdout_lines(pending_lines)
+                    stderr = b''.join(stderr_output)
+                finally:
+                    safe_kill_processes(process, process_logger = self.logger)
 
                 ret = process.returncode
 
@@ -159,27 +211,242 @@ class CLICommand(object):
                     logger_func = self.logger.error if bool(ret) else self.logger.warning
                     err_txt = stderr.decode('utf-8', 'ignore')
                     logger_func(err_txt)
-                    self._stderr_lines = err_txt.split("\n")
+                    self._stderr_lines = err_txt.splitlines()
         except Exception as err:
             self.logger.error(err)
             raise err
         return ret
 
+class CMakePhase(NamedTuple):
+    """
+    Describes one cmake build tree to configure and the targets to build in it.
+    """
+    build_path: str
+    monolithic: bool
+    targets: Tuple[str, ...]
+    config: str
+    defines: Tuple[str, ...] = ()
+
+def cmake_configure_command(phase: CMakePhase, projects_define: str) -> List[str]:
+    """
+    Builds the cmake command line which generates a phase's build tree, to be run from the engine root.
+    :param phase: The build tree to configure
+    :param projects_define: The preformatted -DLY_PROJECTS define of the project to include in the build tree
+    :return the command line arguments
+    """
+    return ['cmake', '-S', '.', '-B', phase.build_path, f'-DLY_MONOLITHIC_GAME={int(phase.monolithic)}', *phase.defines, projects_define]
+
+def cmake_build_command(phase: CMakePhase, parallel_jobs: str) -> List[str]:
+    """
+    Builds the cmake command line which builds all of a phase's targets in a single parallel invocation.
+    :param phase: The build tree and targets to build
+    :param parallel_jobs: The preformatted number of parallel build jobs
+    :return the command line arguments
+    """
+    return ['cmake', '--build', phase.build_path, '--target', *phase.targets, '--config', phase.config, '--parallel', parallel_jobs]
+
 # Helper API
 def process_command(args: list,
                     cwd: pathlib.Path = None,
                     env: os._Environ = None) -> int:
     """
     Wrapper for subprocess.Popen, which handles polling the process for logs, reacting to failure, and cleaning up the process.
+    When INFO logging is disabled stdout is discarded without being read, while stderr is still captured and logged.
     :param args: A list of space separated strings which build up the entire command to run. Similar to the command list of subprocess.Popen
     :param cwd: (Optional) The desired current working directory of the command. Useful for commands which require a differing starting environment.
     :param env: (Optional) Environment to use when processing this command.
     :return the exit code of the program that is run or 1 if no arguments were supplied
     """
     if len(args) == 0:
-        logging.error("function `process_command` must be supplied a non-empty list of arguments")
+        logger.error("function `process_command` must be supplied a non-empty list of arguments")
         return 1
-    return CLICommand(args, cwd, logging.getLogger(), env=env).run()
+    return CLICommand(args, cwd, logger, env=env).run()
+
+def list_files(directory: pathlib.Path) -> List[str]:
+    """
+    Lists the paths of the files directly inside a directory, using the cached type information from os.scandir.
+    Like glob.glob('*.*'), extensionless files and dotfiles are skipped.
+    :param directory: The directory to list
+    :return the file paths, or an empty list if the directory does not exist
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [entry.path for entry in entries if entry.is_file() and not entry.name.startswith('.') and '.' in entry.name]
+    except FileNotFoundError:
+        return []
+
+def copy_file(src: os.PathLike, destination: pathlib.Path) -> None:
+    """
+    Copies a file into a destination directory.
+    Bundles are the largest files in the layout and only need their contents, so they skip the permission copy
+    that shutil.copy does, leaving shutil.copyfile to use the platform's in-kernel copy (e.g. os.sendfile on Linux).
+    :param src: The file to copy
+    :param destination: Directory to copy the file into
+    """
+    target = pathlib.Path(destination) / os.path.basename(src)
+    if target.exists() and os.path.samefile(src, target):
+        # left behind by an earlier --hardlink-files export, replace the link with a real copy
+        target.unlink()
+    if target.suffix.lower() == '.pak':
+        shutil.copyfile(src, target)
+    else:
+        shutil.copy(src, target)
+
+def link_or_copy(src: os.PathLike, destination: pathlib.Path) -> None:
+    """
+    Hard links a file into a destination directory, falling back to a regular copy when a link cannot be made (e.g. across volumes).
+    A link shares its contents with the source, so later in-place edits to the source are visible through it.
+    :param src: The file to link
+    :param destination: Directory to place the link in
+    """
+    target = pathlib.Path(destination) / os.path.basename(src)
+    try:
+        if target.exists():
+            if os.path.samefile(src, target):
+                return
+            # never write through an existing link, as it could share its contents with another build output
+            target.unlink()
+        os.link(src, target)
+    except OSError:
+        copy_file(src, destination)
+
+def copy_files(copies: List[Tuple[os.PathLike, pathlib.Path]], hardlink: bool = False) -> None:
+    """
+    Copies files on a shared thread pool, so that the per-file latency of many small copies overlaps.
+    :param copies: Pairs of (source file, destination directory)
+    :param hardlink: (Optional) Hard link the files instead of copying their contents where possible
+    """
+    copy_function = link_or_copy if hardlink else copy_file
+    with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2) as executor:
+        # consume the results so that any copy failure is raised here
+        list(executor.map(lambda copy: copy_function(*copy), copies))
+
+def archive_zip(root_dir: pathlib.Path, archive_path: pathlib.Path) -> None:
+    """
+    Writes the contents of a directory into a zip archive, streaming each file into the archive.
+    Files that are already compressed archives (such as .pak bundles) are stored as-is rather than deflated a second time.
+    :param root_dir: The directory to archive
+    :param archive_path: The path of the zip archive to create
+    """
+    with zipfile.ZipFile(archive_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for dirpath, dirnames, filenames in os.walk(root_dir):
+            dirnames.sort()
+            for dirname in dirnames:
+                path = os.path.join(dirpath, dirname)
+                archive.write(path, os.path.relpath(path, root_dir))
+            for filename in sorted(filenames):
+                path = os.path.join(dirpath, filename)
+                compress_type = zipfile.ZIP_STORED if filename.lower().endswith(PRECOMPRESSED_EXTENSIONS) else None
+                archive.write(path, os.path.relpath(path, root_dir), compress_type=compress_type)
+
+def cached_validation(path: pathlib.Path, validator: Callable[[pathlib.Path], bool], use_cache: bool = True) -> bool:
+    """
+    Runs a json validator, skipping it when the file is unchanged since it last passed validation.
+    A file is considered unchanged when its modification time and size match the cached fingerprint.
+    :param path: The json file to validate
+    :param validator: The validation function to run on the file
+    :param use_cache: (Optional) Read and update the validation cache. When False the validator always runs.
+    :return True if the file is valid
+    """
+    if not use_cache:
+        return validator(path)
+    try:
+        stat = path.stat()
+    except OSError:
+        return validator(path)
+
+    key = str(path.resolve())
+    fingerprint = f'{validator.__name__}:{stat.st_mtime_ns}:{stat.st_size}'
+    try:
+        cache = json.loads(VALIDATION_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        cache = {}
+    if cache.get(key) == fingerprint:
+        return True
+
+    valid = validator(path)
+    if valid:
+        cache[key] = fingerprint
+        try:
+            VALIDATION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            VALIDATION_CACHE_PATH.write_text(json.dumps(cache, indent=4))
+        except OSError:
+            logger.warning(f"Unable to update validation cache at '{VALIDATION_CACHE_PATH}'")
+    return valid
+
+def hash_files(paths: List[pathlib.Path], *values: str) -> str:
+    """
+    Computes a SHA-256 digest over the contents of a set of files and any additional values.
+    A missing file contributes a marker rather than failing, so that its later creation changes the digest.
+    :param paths: The files to hash, in a stable order
+    :param values: (Optional) Extra strings, such as command arguments, that should also invalidate the digest
+    :return the hex digest
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(str(path).encode('utf-8'))
+        try:
+            with open(path, 'rb') as file:
+                for chunk in iter(lambda: file.read(1024 * 1024), b''):
+                    digest.update(chunk)
+        except FileNotFoundError:
+            digest.update(b'<missing>')
+    for value in values:
+        digest.update(str(value).encode('utf-8'))
+    return digest.hexdigest()
+
+def product_fingerprints(cache_path: pathlib.Path) -> List[str]:
+    """
+    Lists the relative path, modification time and size of every product file in an asset cache.
+    Reprocessing an asset rewrites its products, so this changes even when the asset catalog does not.
+    :param cache_path: The platform asset cache, e.g. <project>/Cache/pc
+    :return one fingerprint string per product file, in a stable order
+    """
+    fingerprints = []
+    def scan(directory: str, relative_dir: str) -> None:
+        try:
+            with os.scandir(directory) as iterator:
+                entries = sorted(iterator, key=lambda entry: entry.name)
+        except FileNotFoundError:
+            # removed by Asset Processor while the cache was being walked
+            return
+        for entry in entries:
+            relative_path = os.path.join(relative_dir, entry.name)
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    scan(entry.path, relative_path)
+                elif entry.is_file():
+                    # on Windows the stat result comes with the directory listing
+                    stat = entry.stat()
+                    fingerprints.append(f'{relative_path}:{stat.st_mtime_ns}:{stat.st_size}')
+            except FileNotFoundError:
+                # temporary or product files can disappear while Asset Processor is running, they are no longer part of the cache
+                continue
+    scan(str(cache_path), '')
+    return fingerprints
+
+def wait_until_released(path: pathlib.Path, timeout: float = 10) -> bool:
+    """
+    Waits until no other process holds a handle that prevents opening a file for writing.
+    Windows refuses the open with a sharing violation until every handle to the file has been closed.
+    :param path: The file to wait on
+    :param timeout: (Optional) Maximum number of seconds to wait
+    :return True if the file could be opened or does not exist, False if the timeout expired
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(path, os.O_RDWR | getattr(os, 'O_BINARY', 0))
+        except FileNotFoundError:
+            return True
+        except PermissionError:
+            if time.monotonic() >= deadline:
+                logger.warning(f"Timed out waiting for '{path}' to be released")
+                return False
+            time.sleep(0.02)
+        else:
+            os.close(fd)
+            return True
 
 
 # EXPORT SCRIPT STARTS HERE!
@@ -203,6 +470,9 @@ if __name__ == "__main__":
     parser.add_argument('-nmbp', '--non-mono-build-path', type=pathlib.Path, default=None)
     parser.add_argument('-mbp', '--mono-build-path', type=pathlib.Path, default=None)
     parser.add_argument('-a', '--archive-output', action='store_true', help='This option places the final output of the build into a compressed archive')
+    parser.add_argument('-hl', '--hardlink-files', action='store_true', help='Hard link build outputs and bundles into the Release Directory instead of copying them, when they are on the same volume. Rebuilding in place afterwards will also change the linked files.')
+    parser.add_argument('-nvc', '--no-validation-cache', action='store_true', help='Always validate the project and engine json files, even if they are unchanged since they last passed validation.')
+    parser.add_argument('-sub', '--skip-unchanged-bundling', action='store_true', help='Skip regenerating the asset lists and bundles when the game seed lists and the processed assets in Cache/pc are unchanged since the last successful export. Changes to engine or gem default seed lists are not detected.')
     parser.add_argument('-q', '--quiet', action='store_true', help='Suppresses logging information unless an error occurs.')
     args = parser.parse_args()
 
@@ -215,78 +485,113 @@ if __name__ == "__main__":
     mono_build_path = (args.engine_path) / 'build' / 'mono' if args.mono_build_path is None else args.mono_build_path
 
     #validation
-    assert valid_o3de_project_json(args.project_path / 'project.json') and valid_o3de_engine_json(args.engine_path / 'engine.json')
+    use_validation_cache = not args.no_validation_cache
+    assert cached_validation(args.project_path / 'project.json', valid_o3de_project_json, use_validation_cache) and cached_validation(args.engine_path / 'engine.json', valid_o3de_engine_json, use_validation_cache)
 
 
     #commands are based on 
     #https://github.com/o3de/o3de-multiplayersample/blob/development/Documentation/PackedAssetBuilds.md
 
-    
+    # argument strings shared by several commands are formatted once
+    projects_define = f'-DLY_PROJECTS={args.project_path}'
+    parallel_jobs = str(os.cpu_count() or 1)
+
+    cmake_phases = []
     #Build o3de-multiplayersample and the engine (non-monolithic)
     if args.build_non_mono_tools:
-        process_command(['cmake', '-S', '.', '-B', str(non_mono_build_path), '-DLY_MONOLITHIC_GAME=0', f'-DLY_PROJECTS={args.project_path}'], cwd=args.engine_path)
+        cmake_phases.append(CMakePhase(build_path=str(non_mono_build_path), monolithic=False,
+                                       targets=('AssetBundler', 'AssetBundlerBatch', 'AssetProcessor', 'AssetProcessorBatch', 'MultiplayerSample.Assets'),
+                                       config='profile'))
+    #Build monolithic game
+    cmake_phases.append(CMakePhase(build_path=str(mono_build_path), monolithic=True,
+                                   targets=('MultiplayerSample.GameLauncher', 'MultiplayerSample.ServerLauncher', 'MultiplayerSample.UnifiedLauncher'),
+                                   config=args.config,
+                                   defines=('-DALLOW_SETTINGS_REGISTRY_DEVELOPMENT_OVERRIDES=0',)))
 
-        process_command(['cmake', '--build', str(non_mono_build_path), '--target', 'AssetBundler', 'AssetBundlerBatch', 'AssetProcessor', 'AssetProcessorBatch', '--config','profile'], cwd=args.engine_path)
+    for phase in cmake_phases:
+        process_command(cmake_configure_command(phase, projects_define), cwd=args.engine_path)
 
-        process_command(['cmake', '--build', str(non_mono_build_path), '--target', 'MultiplayerSample.Assets', '--config', 'profile'], cwd=args.engine_path)
-    
-    #Build monolithic game
-    process_command(['cmake', '-S', '.', '-B', str(mono_build_path), '-DLY_MONOLITHIC_GAME=1', '-DALLOW_SETTINGS_REGISTRY_DEVELOPMENT_OVERRIDES=0', f'-DLY_PROJECTS={args.project_path}'], cwd=args.engine_path)
-    
-    process_command(['cmake', '--build', str(mono_build_path), '--target', 'MultiplayerSample.GameLauncher', 'MultiplayerSample.ServerLauncher', 'MultiplayerSample.UnifiedLauncher', '--config', args.config], cwd=args.engine_path)
+        process_command(cmake_build_command(phase, parallel_jobs), cwd=args.engine_path)
 
     #Bundle content
-    asset_bundler_batch_path = non_mono_build_path / 'bin' / 'profile' / 'AssetBundlerBatch'
-    engine_asset_list_path = args.project_path / 'AssetBundling' /  'AssetLists' / 'engine_pc.assetlist'
+    asset_bundler_batch = str(non_mono_build_path / 'bin' / 'profile' / 'AssetBundlerBatch')
+    bundler_project_args = ['--project-path', str(args.project_path), '--allowOverwrites']
+    engine_asset_list_path = str(args.project_path / 'AssetBundling' /  'AssetLists' / 'engine_pc.assetlist')
     
-    process_command([asset_bundler_batch_path, 'assetLists','--addDefaultSeedListFiles', '--assetListFile', engine_asset_list_path, '--project-path', args.project_path, '--allowOverwrites' ], cwd=args.engine_path)
+    engine_asset_list_command = [asset_bundler_batch, 'assetLists','--addDefaultSeedListFiles', '--assetListFile', engine_asset_list_path, *bundler_project_args]
 
 
-    game_asset_list_path = args.project_path /'AssetBundling'/'AssetLists'/'game_pc.assetlist'
+    game_asset_list_path = str(args.project_path /'AssetBundling'/'AssetLists'/'game_pc.assetlist')
     seed_folder_path = args.project_path/'AssetBundling'/'SeedLists'
 
-    game_asset_list_command = [asset_bundler_batch_path, 'assetLists', '--assetListFile', game_asset_list_path, 
-                    '--seedListFile', seed_folder_path  / 'BasePopcornFxSeedList.seed',
-                    '--seedListFile', seed_folder_path  / 'GameSeedList.seed']
-
+    game_seed_files = [seed_folder_path / 'BasePopcornFxSeedList.seed', seed_folder_path / 'GameSeedList.seed']
     if args.config == 'profile':
-        game_asset_list_command += ['--seedListFile', seed_folder_path / 'ProfileOnlySeedList.seed']
+        game_seed_files.append(seed_folder_path / 'ProfileOnlySeedList.seed')
+    game_seed_files.append(seed_folder_path / 'VFXSeedList.seed')
 
-    game_asset_list_command += ['--seedListFile', seed_folder_path / 'VFXSeedList.seed', '--project-path', args.project_path, '--allowOverwrites']
-
-    process_command(game_asset_list_command, cwd=args.engine_path)
+    game_asset_list_command = [asset_bundler_batch, 'assetLists', '--assetListFile', game_asset_list_path]
+    for seed_file in game_seed_files:
+        game_asset_list_command += ['--seedListFile', str(seed_file)]
+    game_asset_list_command += bundler_project_args
 
     engine_bundle_path = args.project_path / 'AssetBundling' / 'Bundles' / 'engine_pc.pak'
-    process_command([asset_bundler_batch_path, 'bundles', '--assetListFile', engine_asset_list_path, '--outputBundlePath', engine_bundle_path, '--project-path', args.project_path, '--allowOverwrites'], cwd=args.engine_path)
-
-    # This is to prevent any accidental file locking mechanism from failing subsequent bundling operations
-    time.sleep(1)
-
+    engine_bundle_command = [asset_bundler_batch, 'bundles', '--assetListFile', engine_asset_list_path, '--outputBundlePath', str(engine_bundle_path), *bundler_project_args]
     game_bundle_path = args.project_path / 'AssetBundling' / 'Bundles' / 'game_pc.pak'
-    process_command([asset_bundler_batch_path, 'bundles', '--assetListFile', game_asset_list_path, '--outputBundlePath', game_bundle_path, '--project-path', args.project_path, '--allowOverwrites'], cwd=args.engine_path)
+    game_bundle_command = [asset_bundler_batch, 'bundles', '--assetListFile', game_asset_list_path, '--outputBundlePath', str(game_bundle_path), *bundler_project_args]
+
+    # When requested, asset lists and bundles are only regenerated if the game seeds or the processed assets have changed
+    bundling_digest_path = args.project_path / 'AssetBundling' / '.last_digest'
+    bundling_outputs = [pathlib.Path(engine_asset_list_path), pathlib.Path(game_asset_list_path), engine_bundle_path, game_bundle_path]
+    bundling_digest = None
+    if args.skip_unchanged_bundling:
+        bundling_digest = hash_files(game_seed_files,
+                                     *engine_asset_list_command, *game_asset_list_command, *engine_bundle_command, *game_bundle_command,
+                                     *product_fingerprints(args.project_path / 'Cache' / 'pc'))
+    bundling_up_to_date = (bundling_digest is not None
+                           and all(output.is_file() for output in bundling_outputs)
+                           and bundling_digest_path.is_file()
+                           and bundling_digest_path.read_text().strip() == bundling_digest)
+
+    if bundling_up_to_date:
+        logger.info("Seed lists and processed assets are unchanged since the last export, skipping asset list and bundle generation")
+    else:
+        bundling_results = [process_command(engine_asset_list_command, cwd=args.engine_path)]
+
+        bundling_results.append(process_command(game_asset_list_command, cwd=args.engine_path))
+
+        bundling_results.append(process_command(engine_bundle_command, cwd=args.engine_path))
+
+        # This is to prevent any accidental file locking mechanism from failing subsequent bundling operations
+        wait_until_released(engine_bundle_path)
+
+        bundling_results.append(process_command(game_bundle_command, cwd=args.engine_path))
+
+        # only remember the inputs once every step has succeeded, so a failed run is retried next time.
+        # A run without a digest also forgets the old one, as the outputs no longer match the inputs it describes
+        if any(bundling_results) or bundling_digest is None:
+            bundling_digest_path.unlink(missing_ok=True)
+        else:
+            bundling_digest_path.write_text(bundling_digest)
 
     # Create Launcher Layout Directory
-    import shutil
     output_cache_path = args.output_path / 'Cache' / 'pc' 
     output_aws_gem_path = args.output_path / 'Gems' / 'AWSCore'
     os.makedirs(output_cache_path, exist_ok=True)
     os.makedirs(output_aws_gem_path, exist_ok=True)
 
-    for file in glob.glob(str(pathlib.PurePath(args.project_path / 'AssetBundling' / 'Bundles' / '*.pak'))):
-        shutil.copy(file, output_cache_path)
-    for file in glob.glob(str(pathlib.PurePath(mono_build_path / 'bin' / args.config / '*.*'))):
-        shutil.copy(file, args.output_path)
-    
-    for file in glob.glob(str(pathlib.PurePath(mono_build_path / 'bin' / args.config / 'Gems' / 'AWSCore' / '*.*'))):
-        shutil.copy(file, output_aws_gem_path)
-    for file in glob.glob(str(pathlib.PurePath(args.project_path / 'launch_*.*'))):
-        shutil.copy(file, args.output_path)
+    copies = [(file, output_cache_path) for file in (args.project_path / 'AssetBundling' / 'Bundles').glob('*.pak')]
+    copies += [(file, args.output_path) for file in list_files(mono_build_path / 'bin' / args.config)]
+    copies += [(file, output_aws_gem_path) for file in list_files(mono_build_path / 'bin' / args.config / 'Gems' / 'AWSCore')]
+    copies += [(file, args.output_path) for file in args.project_path.glob('launch_*.*')]
+    copy_files(copies, hardlink=args.hardlink_files)
 
     # Optionally zip the layout directory if the user requests
     if args.archive_output:
-        archive_name = args.output_path
         logger.info("Archiving output directory (this may take a while)...")
-        shutil.make_archive(args.output_path, args.archive_output_format, root_dir = args.output_path)
+        if args.archive_output_format == 'zip':
+            archive_zip(args.output_path, args.output_path.with_name(f'{args.output_path.name}.zip'))
+        else:
+            shutil.make_archive(args.output_path, args.archive_output_format, root_dir = args.output_path)
 
     logger.info(f"Exporting project is complete! Release Directory can be found at {args.output_path}")
 